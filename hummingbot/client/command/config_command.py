@@ -266,6 +266,7 @@ class ConfigCommand:
                 save_to_yml(file_path, config_map)
                 self.notify("\nNew configuration saved.")
                 if client_config_key:
+                    self.reset_client_config_cache()
                     self.list_client_configs()
                 else:
                     self.list_strategy_configs()
@@ -1,33 +1,76 @@
 import asyncio
-import copy
+import inspect
 import os
-import shutil
+import sys
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Type
 
+import hummingbot
+from hummingbot.client.config.config_data_types import BaseClientModel
 from hummingbot.client.config.config_helpers import (
     ClientConfigAdapter,
     ConfigValidationError,
     default_strategy_file_path,
     format_config_file_name,
     get_strategy_config_map,
-    get_strategy_template_path,
     parse_config_default_to_text,
     parse_cvar_value,
     save_previous_strategy_value,
     save_to_yml,
     save_to_yml_legacy,
+    write_strategy_template,
 )
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.strategy_config_data_types import BaseStrategyConfigMap
 from hummingbot.client.settings import STRATEGIES_CONF_DIR_PATH, required_exchanges
-from hummingbot.client.ui.completer import load_completer
+from hummingbot.client.ui.completer import HummingbotCompleter, load_completer
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
 
 
+@lru_cache(maxsize=None)
+def _promptable_config_keys(model_cls: Type[BaseClientModel]) -> Tuple[str, ...]:
+    """
+    The keys of the fields to prompt for when creating a new config of type `model_cls`.
+    """
+    promptable_keys = []
+    for key, field in model_cls.__fields__.items():
+        client_data = field.field_info.extra.get("client_data")
+        if client_data is not None and (client_data.prompt_on_new or field.required):
+            promptable_keys.append(key)
+    return tuple(promptable_keys)
+
+
+@lru_cache(maxsize=None)
+def _can_hold_sub_model(model_cls: Type[BaseClientModel], attr: str) -> bool:
+    """
+    Whether the `attr` field of `model_cls` is typed as a config model, or a union or collection including one.
+    """
+    field = model_cls.__fields__[attr]
+    field_types = [sub_field.type_ for sub_field in field.sub_fields] if field.sub_fields else [field.type_]
+    return any(inspect.isclass(t) and issubclass(t, BaseClientModel) for t in field_types)
+
+
+@lru_cache(maxsize=1024)
+def _split_config_path(config_path: str) -> Tuple[Optional[Callable[[Any], Any]], str]:
+    """
+    Splits a dotted config path into a getter for the sub-model holding the config (`None` for a top-level
+    config) and the config's attribute name.
+    """
+    sub_model_path, _, attr = config_path.rpartition(".")
+    sub_model_getter = attrgetter(sub_model_path) if sub_model_path else None
+    return sub_model_getter, attr
+
+
+def _save_new_config_legacy(strategy: str, strategy_path: Path, config_map: Dict[str, ConfigVar]):
+    write_strategy_template(strategy, strategy_path)
+    save_to_yml_legacy(str(strategy_path), config_map)
+
+
 class CreateCommand:
     def create(self,  # type: HummingbotApplication
                file_name):
@@ -43,41 +86,47 @@ class CreateCommand:
         self,  # type: HummingbotApplication
         file_name,
     ):
-        self.app.clear_input()
+        app = self.app
+        notify = self.notify
+        app.clear_input()
         self.placeholder_mode = True
-        self.app.hide_input = True
+        app.hide_input = True
         required_exchanges.clear()
 
         strategy = await self.get_strategy_name()
 
-        if self.app.to_stop_config:
+        if app.to_stop_config:
             return
 
         config_map = get_strategy_config_map(strategy)
-        self.notify(f"Please see https://docs.hummingbot.org/strategies/{strategy.replace('_', '-')}/ "
-                    f"while setting up these below configuration.")
+        notify(f"Please see https://docs.hummingbot.org/strategies/{strategy.replace('_', '-')}/ "
+               f"while setting up these below configuration.")
 
         if isinstance(config_map, ClientConfigAdapter):
             await self.prompt_for_model_config(config_map)
-            if not self.app.to_stop_config:
+            if not app.to_stop_config:
                 file_name = await self.save_config_to_file(file_name, config_map)
         elif config_map is not None:
             file_name = await self.prompt_for_configuration_legacy(file_name, strategy, config_map)
         else:
-            self.app.to_stop_config = True
+            app.to_stop_config = True
 
-        if self.app.to_stop_config:
+        if app.to_stop_config:
             return
 
         save_previous_strategy_value(file_name, self.client_config_map)
         self.strategy_file_name = file_name
         self.strategy_name = strategy
         self.strategy_config_map = config_map
-        # Reload completer here otherwise the new file will not appear
-        self.app.input_field.completer = load_completer(self)
-        self.notify(f"A new config file has been created: {self.strategy_file_name}")
+        # Reload the config file names here otherwise the new file will not appear
+        completer = app.input_field.completer
+        if isinstance(completer, HummingbotCompleter):
+            completer.reload_strategy_config_file_names()
+        else:
+            app.input_field.completer = load_completer(self)
+        notify(f"A new config file has been created: {self.strategy_file_name}")
         self.placeholder_mode = False
-        self.app.hide_input = False
+        app.hide_input = False
 
         await self.verify_status()
 
@@ -95,15 +144,10 @@ class CreateCommand:
         self,  # type: HummingbotApplication
         config_map: ClientConfigAdapter,
     ):
-        for key in config_map.keys():
-            client_data = config_map.get_client_data(key)
-            if (
-                client_data is not None
-                and (client_data.prompt_on_new or config_map.is_required(key))
-            ):
-                await self.prompt_a_config(config_map, key)
-                if self.app.to_stop_config:
-                    break
+        for key in _promptable_config_keys(type(config_map.hb_config)):
+            await self.prompt_a_config(config_map, key)
+            if self.app.to_stop_config:
+                break
 
     async def prompt_for_configuration_legacy(
         self,  # type: HummingbotApplication
@@ -111,8 +155,10 @@ class CreateCommand:
         strategy: str,
         config_map: Dict,
     ):
-        config_map_backup = copy.deepcopy(config_map)
-        # assign default values and reset those not required
+        app = self.app
+        config_map_backup = {key: config.value for key, config in config_map.items()}
+        # assign default values and reset those not required, so that `required_if` conditions evaluated while
+        # prompting do not see values left over from a previous create or import
         for config in config_map.values():
             if config.required:
                 config.value = config.default
@@ -120,29 +166,25 @@ class CreateCommand:
                 config.value = None
         for config in config_map.values():
             if config.prompt_on_new and config.required:
-                if not self.app.to_stop_config:
+                if not app.to_stop_config:
                     await self.prompt_a_config_legacy(config)
                 else:
                     break
             else:
                 config.value = config.default
 
-        if self.app.to_stop_config:
-            self.restore_config_legacy(config_map, config_map_backup)
-            self.app.set_text("")
+        if self._check_stop_config_legacy(config_map, config_map_backup):
             return
 
         if file_name is None:
             file_name = await self.prompt_new_file_name(strategy)
-            if self.app.to_stop_config:
-                self.restore_config_legacy(config_map, config_map_backup)
-                self.app.set_text("")
+            if self._check_stop_config_legacy(config_map, config_map_backup):
                 return
-        self.app.change_prompt(prompt=">>> ")
+        app.change_prompt(prompt=">>> ")
         strategy_path = STRATEGIES_CONF_DIR_PATH / file_name
-        template = get_strategy_template_path(strategy)
-        shutil.copy(template, strategy_path)
-        save_to_yml_legacy(str(strategy_path), config_map)
+        await self.ev_loop.run_in_executor(
+            hummingbot.get_executor(), _save_new_config_legacy, strategy, strategy_path, config_map
+        )
         return file_name
 
     async def prompt_a_config(
@@ -152,32 +194,34 @@ class CreateCommand:
         input_value=None,
         assign_default=True,
     ):
-        config_path = config.split(".")
-        while len(config_path) != 1:
-            sub_model_attr = config_path.pop(0)
-            model = getattr(model, sub_model_attr)
-        config = config_path[0]
-        if input_value is None:
-            prompt = await model.get_client_prompt(config)
-            if prompt is not None:
-                if assign_default:
-                    default = model.get_default_str_repr(attr_name=config)
-                    self.app.set_text(default)
-                prompt = f"{prompt} >>> "
-                client_data = model.get_client_data(config)
-                input_value = await self.app.prompt(prompt=prompt, is_password=client_data.is_secure)
-
-        new_config_value = None
-        if not self.app.to_stop_config and input_value is not None:
+        sub_model_getter, config = _split_config_path(config)
+        if sub_model_getter is not None:
+            model = sub_model_getter(model)
+        while True:
+            if input_value is None:
+                prompt = await model.get_client_prompt(config)
+                if prompt is not None:
+                    if assign_default:
+                        default = model.get_default_str_repr(attr_name=config)
+                        self.app.set_text(default)
+                    prompt = f"{prompt} >>> "
+                    client_data = model.get_client_data(config)
+                    input_value = await self.app.prompt(prompt=prompt, is_password=client_data.is_secure)
+
+            if self.app.to_stop_config or input_value is None:
+                return
             try:
-                setattr(model, config, input_value)
-                new_config_value = getattr(model, config)
+                model.validate_and_set(config, input_value)
+                break
             except ConfigValidationError as e:
                 self.notify(str(e))
-                new_config_value = await self.prompt_a_config(model, config)
+                input_value = None
+                assign_default = True
 
-        if not self.app.to_stop_config and isinstance(new_config_value, ClientConfigAdapter):
-            await self.prompt_for_model_config(new_config_value)
+        if _can_hold_sub_model(type(model.hb_config), config):
+            new_config_value = getattr(model, config)
+            if isinstance(new_config_value, ClientConfigAdapter):
+                await self.prompt_for_model_config(new_config_value)
 
     async def prompt_a_config_legacy(
         self,  # type: HummingbotApplication
@@ -185,25 +229,29 @@ class CreateCommand:
         input_value=None,
         assign_default=True,
     ):
+        app = self.app
+        notify = self.notify
         if config.key == "inventory_price":
             await self.inventory_price_prompt_legacy(self.strategy_config_map, input_value)
             return
-        if input_value is None:
-            if assign_default:
-                self.app.set_text(parse_config_default_to_text(config))
-            prompt = await config.get_prompt()
-            input_value = await self.app.prompt(prompt=prompt, is_password=config.is_secure)
+        while True:
+            if input_value is None:
+                if assign_default:
+                    app.set_text(parse_config_default_to_text(config))
+                prompt = await config.get_prompt()
+                input_value = await app.prompt(prompt=prompt, is_password=config.is_secure)
 
-        if self.app.to_stop_config:
-            return
-        value = parse_cvar_value(config, input_value)
-        err_msg = await config.validate(input_value)
-        if err_msg is not None:
-            self.notify(err_msg)
+            if app.to_stop_config:
+                return
+            value = parse_cvar_value(config, input_value)
+            err_msg = await config.validate(input_value)
+            if err_msg is None:
+                config.value = value
+                break
+            notify(err_msg)
             config.value = None
-            await self.prompt_a_config_legacy(config)
-        else:
-            config.value = value
+            input_value = None
+            assign_default = True
 
     async def save_config_to_file(
         self,  # type: HummingbotApplication
@@ -217,31 +265,32 @@ class CreateCommand:
                 return
         self.app.change_prompt(prompt=">>> ")
         strategy_path = Path(STRATEGIES_CONF_DIR_PATH) / file_name
-        save_to_yml(strategy_path, config_map)
+        await self.ev_loop.run_in_executor(hummingbot.get_executor(), save_to_yml, strategy_path, config_map)
         return file_name
 
     async def prompt_new_file_name(self,  # type: HummingbotApplication
                                    strategy):
         file_name = default_strategy_file_path(strategy)
-        self.app.set_text(file_name)
-        input = await self.app.prompt(prompt="Enter a new file name for your configuration >>> ")
-        input = format_config_file_name(input)
-        file_path = os.path.join(STRATEGIES_CONF_DIR_PATH, input)
-        if input is None or input == "":
-            self.notify("Value is required.")
-            return await self.prompt_new_file_name(strategy)
-        elif os.path.exists(file_path):
-            self.notify(f"{input} file already exists, please enter a new name.")
-            return await self.prompt_new_file_name(strategy)
-        else:
-            return input
+        while True:
+            self.app.set_text(file_name)
+            input = await self.app.prompt(prompt="Enter a new file name for your configuration >>> ")
+            input = format_config_file_name(input)
+            if input is None or input == "":
+                self.notify("Value is required.")
+            elif os.path.exists(os.path.join(STRATEGIES_CONF_DIR_PATH, input)):
+                self.notify(f"{input} file already exists, please enter a new name.")
+            else:
+                return input
 
     async def verify_status(
         self  # type: HummingbotApplication
     ):
         try:
-            timeout = float(self.client_config_map.commands_timeout.create_command_timeout)
-            all_status_go = await asyncio.wait_for(self.status_check_all(), timeout)
+            if sys.version_info >= (3, 11):  # runs the check in the current task instead of wrapping it in a new one
+                async with asyncio.timeout(self.create_command_timeout):
+                    all_status_go = await self.status_check_all()
+            else:
+                all_status_go = await asyncio.wait_for(self.status_check_all(), self.create_command_timeout)
         except asyncio.TimeoutError:
             self.notify("\nA network error prevented the connection check to complete. See logs for more details.")
             self.strategy_file_name = None
@@ -251,7 +300,25 @@ class CreateCommand:
         if all_status_go:
             self.notify("\nEnter \"start\" to start market making.")
 
+    def _check_stop_config_legacy(
+        self,  # type: HummingbotApplication
+        config_map: Dict[str, ConfigVar],
+        config_map_backup: Dict[str, Any],
+    ) -> bool:
+        """
+        Restores the config values and clears the input if the configuration was stopped.
+        :return: True if the configuration was stopped
+        """
+        if self.app.to_stop_config:
+            self.restore_config_legacy(config_map, config_map_backup)
+            self.app.set_text("")
+            return True
+        return False
+
     @staticmethod
-    def restore_config_legacy(config_map: Dict[str, ConfigVar], config_map_backup: Dict[str, ConfigVar]):
-        for key in config_map:
-            config_map[key] = config_map_backup[key]
+    def restore_config_legacy(config_map: Dict[str, ConfigVar], config_map_backup: Dict[str, Any]):
+        """
+        Restores the config values captured in `config_map_backup` (a `{key: value}` snapshot) into `config_map`.
+        """
+        for key, value in config_map_backup.items():
+            config_map[key].value = value
@@ -1,5 +1,6 @@
 import contextlib
 import inspect
+import io
 import json
 import logging
 import shutil
@@ -7,9 +8,11 @@ from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
 from datetime import date, datetime, time
 from decimal import Decimal
-from os import listdir, scandir, unlink
-from os.path import isfile, join
+from functools import lru_cache
+from os import listdir, replace, scandir, unlink
+from os.path import basename, dirname, isfile, join, realpath
 from pathlib import Path, PosixPath, PureWindowsPath
+from tempfile import NamedTemporaryFile
 from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Type, Union
 
 import ruamel.yaml
@@ -17,7 +20,6 @@ import yaml
 from pydantic import SecretStr, ValidationError
 from pydantic.fields import FieldInfo
 from pydantic.main import ModelMetaclass, validate_model
-from yaml import SafeDumper
 
 from hummingbot import get_strategy_list, root_path
 from hummingbot.client.config.client_config_map import ClientConfigMap, CommandShortcutModel
@@ -38,6 +40,11 @@ from hummingbot.client.settings import (
     AllConnectorSettings,
 )
 
+try:  # use the libyaml bindings when available
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 # Use ruamel.yaml to preserve order and comments in .yml file
 yaml_parser = ruamel.yaml.YAML()  # legacy
 
@@ -257,6 +264,34 @@ class ClientConfigAdapter:
             ]
         return validation_errors
 
+    def validate_and_set(self, attr: str, value: Any):
+        """Validates the value and assigns it to the attribute, like `setattr`.
+
+        If the model has no root validators, the field is validated and assigned directly instead of going through
+        pydantic's assignment validation, which rebuilds the model's whole `__dict__` on every assignment.
+        """
+        hb_config = self._hb_config
+        model_cls = type(hb_config)
+        field = hb_config.__fields__.get(attr)
+        if (
+            field is None
+            or not field.field_info.allow_mutation
+            or not hb_config.__config__.validate_assignment
+            or not hb_config.__config__.allow_mutation
+            or hb_config.__config__.frozen
+            or model_cls.__pre_root_validators__
+            or model_cls.__post_root_validators__
+        ):
+            setattr(self, attr, value)
+            return
+
+        values = {k: v for k, v in hb_config.__dict__.items() if k != attr}
+        value, error = field.validate(value, values, loc=attr, cls=model_cls)
+        if error:
+            raise ConfigValidationError(retrieve_validation_error_msg(ValidationError([error], model_cls)))
+        hb_config.__dict__[attr] = value
+        hb_config.__fields_set__.add(attr)
+
     def setattr_no_validation(self, attr: str, value: Any):
         with self._disable_validation():
             setattr(self, attr, value)
@@ -349,7 +384,7 @@ class ClientConfigAdapter:
                 conf_as_dictionary = {attribute: value}
             self._encrypt_secrets(conf_as_dictionary)
 
-            yaml_config = yaml.safe_dump(conf_as_dictionary, sort_keys=False)
+            yaml_config = yaml.dump(conf_as_dictionary, Dumper=SafeDumper, sort_keys=False)
             fragments_with_comments.append(yaml_config)
 
 
@@ -470,6 +505,7 @@ async def copy_strategy_template(strategy: str) -> str:
     return new_fname
 
 
+@lru_cache(maxsize=None)
 def get_strategy_template_path(strategy: str) -> Path:
     """
     Given the strategy name, return its template config `yml` file name.
@@ -477,6 +513,18 @@ def get_strategy_template_path(strategy: str) -> Path:
     return TEMPLATE_PATH / f"{CONF_PREFIX}{strategy}{CONF_POSTFIX}_TEMPLATE.yml"
 
 
+def write_strategy_template(strategy: str, strategy_path: Path):
+    """
+    Write the template config `yml` file of the strategy to `strategy_path`.
+    """
+    Path(strategy_path).write_bytes(_get_strategy_template_bytes(strategy))
+
+
+@lru_cache(maxsize=32)
+def _get_strategy_template_bytes(strategy: str) -> bytes:
+    return get_strategy_template_path(strategy).read_bytes()
+
+
 def _merge_dicts(*args: Dict[str, ConfigVar]) -> OrderedDict:
     """
     Helper function to merge a few dictionaries into an ordered dictionary.
@@ -501,20 +549,34 @@ def get_strategy_config_map(
     Given the name of a strategy, find and load strategy-specific config map.
     """
     try:
-        config_cls = get_strategy_pydantic_config_cls(strategy)
-        if config_cls is None:  # legacy
-            cm_key = f"{strategy}_config_map"
-            strategy_module = __import__(f"hummingbot.strategy.{strategy}.{cm_key}",
-                                         fromlist=[f"hummingbot.strategy.{strategy}"])
-            config_map = getattr(strategy_module, cm_key)
+        config_source = _get_strategy_config_source(strategy)
+        if isinstance(config_source, dict):  # legacy
+            config_map = config_source
         else:
-            hb_config = config_cls.construct()
+            hb_config = config_source.construct()
             config_map = ClientConfigAdapter(hb_config)
     except Exception:
         config_map = defaultdict()
     return config_map
 
 
+@lru_cache(maxsize=None)
+def _get_strategy_config_source(strategy: str) -> Union[ModelMetaclass, Dict[str, ConfigVar]]:
+    """
+    Resolves the pydantic config class of a strategy, or its module-level legacy config map, once per strategy.
+    Legacy config maps are shared module globals, so they are returned as-is rather than copied.
+    """
+    config_cls = get_strategy_pydantic_config_cls(strategy)
+    if config_cls is None:  # legacy
+        cm_key = f"{strategy}_config_map"
+        strategy_module = __import__(f"hummingbot.strategy.{strategy}.{cm_key}",
+                                     fromlist=[f"hummingbot.strategy.{strategy}"])
+        config_source = getattr(strategy_module, cm_key)
+    else:
+        config_source = config_cls
+    return config_source
+
+
 def get_strategy_starter_file(strategy: str) -> Callable:
     """
     Given the name of a strategy, find and load the `start` function in
@@ -555,7 +617,7 @@ def validate_strategy_file(file_path: Path) -> Optional[str]:
 
 def read_yml_file(yml_path: Path) -> Dict[str, Any]:
     with open(yml_path, "r", encoding="utf-8") as file:
-        data = yaml.safe_load(file) or {}
+        data = yaml.load(file, Loader=SafeLoader) or {}
     return dict(data)
 
 
@@ -787,14 +849,15 @@ def save_to_yml_legacy(yml_path: str, cm: Dict[str, ConfigVar]):
     try:
         with open(yml_path, encoding="utf-8") as stream:
             data = yaml_parser.load(stream) or {}
-            for key in cm:
-                cvar = cm.get(key)
-                if type(cvar.value) == Decimal:
-                    data[key] = float(cvar.value)
-                else:
-                    data[key] = cvar.value
-            with open(yml_path, "w+", encoding="utf-8") as outfile:
-                yaml_parser.dump(data, outfile)
+        for key in cm:
+            cvar = cm.get(key)
+            if type(cvar.value) == Decimal:
+                data[key] = float(cvar.value)
+            else:
+                data[key] = cvar.value
+        yml_buffer = io.StringIO()
+        yaml_parser.dump(data, yml_buffer)
+        _write_yml_str(yml_path, yml_buffer.getvalue())
     except Exception as e:
         logging.getLogger().error("Error writing configs: %s" % (str(e),), exc_info=True)
 
@@ -802,12 +865,35 @@ def save_to_yml_legacy(yml_path: str, cm: Dict[str, ConfigVar]):
 def save_to_yml(yml_path: Path, cm: ClientConfigAdapter):
     try:
         cm_yml_str = cm.generate_yml_output_str_with_comments()
-        with open(yml_path, "w", encoding="utf-8") as outfile:
-            outfile.write(cm_yml_str)
+        _write_yml_str(yml_path, cm_yml_str)
     except Exception as e:
         logging.getLogger().error("Error writing configs: %s" % (str(e),), exc_info=True)
 
 
+def _write_yml_str(yml_path: Union[str, Path], yml_str: str):
+    """
+    Writes the serialized config in one go. An existing config file is replaced atomically through a uniquely
+    named temporary file in the same directory, keeping its file mode, and symlinks are written through rather
+    than replaced, so that the config file is never left partially written.
+    """
+    yml_path = realpath(yml_path)
+    if not isfile(yml_path):
+        with open(yml_path, "w", encoding="utf-8") as outfile:
+            outfile.write(yml_str)
+        return
+    tmp_file = NamedTemporaryFile(
+        "w", encoding="utf-8", dir=dirname(yml_path), prefix=f".{basename(yml_path)}.", suffix=".tmp", delete=False
+    )
+    try:
+        with tmp_file as outfile:
+            outfile.write(yml_str)
+        shutil.copymode(yml_path, tmp_file.name)
+        replace(tmp_file.name, yml_path)
+    except BaseException:
+        unlink(tmp_file.name)
+        raise
+
+
 def write_config_to_yml(
     strategy_config_map: Union[ClientConfigAdapter, Dict],
     strategy_file_name: str,
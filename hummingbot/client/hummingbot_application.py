@@ -4,6 +4,7 @@ import asyncio
 import logging
 import time
 from collections import deque
+from functools import cached_property
 from typing import Deque, Dict, List, Optional, Tuple, Union
 
 from hummingbot.client.command import __all__ as commands
@@ -131,6 +132,14 @@ class HummingbotApplication(*commands):
     def instance_id(self) -> str:
         return self.client_config_map.instance_id
 
+    @cached_property
+    def create_command_timeout(self) -> float:
+        return float(self.client_config_map.commands_timeout.create_command_timeout)
+
+    def reset_client_config_cache(self):
+        """Drops the values cached from the client config so that they are re-read after it changes."""
+        self.__dict__.pop("create_command_timeout", None)
+
     @property
     def gateway_config_keys(self) -> List[str]:
         return self._gateway_monitor.gateway_config_keys
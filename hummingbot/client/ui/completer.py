@@ -80,6 +80,9 @@ class HummingbotCompleter(Completer):
         self._gateway_networks = []
         self._list_gateway_wallets_parameters = {"wallets": [], "chain": ""}
 
+    def reload_strategy_config_file_names(self):
+        self._path_completer = WordCompleter(file_name_list(str(STRATEGIES_CONF_DIR_PATH), "yml"))
+
     def set_gateway_chains(self, gateway_chains):
         self._gateway_chains = gateway_chains
 
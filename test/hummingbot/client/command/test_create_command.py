@@ -2,10 +2,13 @@ import asyncio
 import unittest
 from decimal import Decimal
 from test.mock.mock_cli import CLIMockingAssistant
-from typing import Awaitable
+from typing import Awaitable, Union
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from pydantic import Field, root_validator, validator
+
 from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_data_types import BaseClientModel, ClientFieldData
 from hummingbot.client.config.config_helpers import (
     ClientConfigAdapter,
     get_strategy_config_map,
@@ -59,7 +62,7 @@ class CreateCommandTest(unittest.TestCase):
         except asyncio.TimeoutError:  # the coroutine did not finish on time
             raise RuntimeError
 
-    @patch("shutil.copy")
+    @patch("hummingbot.client.command.create_command.write_strategy_template")
     @patch("hummingbot.client.command.create_command.save_to_yml_legacy")
     @patch("hummingbot.client.config.security.Security.is_decryption_done")
     @patch("hummingbot.client.command.status_command.StatusCommand.validate_required_connections")
@@ -98,7 +101,7 @@ class CreateCommandTest(unittest.TestCase):
         self.assertEqual(base_strategy, self.app.strategy_name)
         self.assertTrue(self.cli_mock_assistant.check_log_called_with(msg="Value must be more than 0."))
 
-    @patch("shutil.copy")
+    @patch("hummingbot.client.command.create_command.write_strategy_template")
     @patch("hummingbot.client.command.create_command.save_to_yml_legacy")
     @patch("hummingbot.client.config.security.Security.is_decryption_done")
     @patch("hummingbot.client.command.status_command.StatusCommand.validate_required_connections")
@@ -138,8 +141,9 @@ class CreateCommandTest(unittest.TestCase):
     def test_create_command_restores_config_map_after_config_stop(self):
         base_strategy = "pure_market_making"
         strategy_config = get_strategy_config_map(base_strategy)
+        exchange_config = strategy_config["exchange"]
         original_exchange = "bybit"
-        strategy_config["exchange"].value = original_exchange
+        exchange_config.value = original_exchange
 
         self.cli_mock_assistant.queue_prompt_reply(base_strategy)  # strategy
         self.cli_mock_assistant.queue_prompt_reply("binance")  # spot connector
@@ -148,6 +152,7 @@ class CreateCommandTest(unittest.TestCase):
         self.async_run_with_timeout(self.app.prompt_for_configuration(None))
         strategy_config = get_strategy_config_map(base_strategy)
 
+        self.assertIs(exchange_config, strategy_config["exchange"])
         self.assertEqual(original_exchange, strategy_config["exchange"].value)
 
     def test_create_command_restores_config_map_after_config_stop_on_new_file_prompt(self):
@@ -171,7 +176,7 @@ class CreateCommandTest(unittest.TestCase):
 
         self.assertEqual(original_exchange, strategy_config["exchange"].value)
 
-    @patch("shutil.copy")
+    @patch("hummingbot.client.command.create_command.write_strategy_template")
     @patch("hummingbot.client.command.create_command.save_to_yml_legacy")
     @patch("hummingbot.client.config.security.Security.is_decryption_done")
     @patch("hummingbot.client.command.status_command.StatusCommand.validate_required_connections")
@@ -210,3 +215,84 @@ class CreateCommandTest(unittest.TestCase):
                 msg="\nA network error prevented the connection check to complete. See logs for more details."
             )
         )
+
+    def test_prompt_for_model_config_re_prompts_invalid_values_and_prompts_for_selected_mode(self):
+        class DummyModeOne(BaseClientModel):
+            mode_attr: int = Field(
+                default=...,
+                client_data=ClientFieldData(prompt=lambda mi: "Mode attr", prompt_on_new=True),
+            )
+
+            class Config:
+                title = "mode_one"
+
+        class DummyModeTwo(BaseClientModel):
+            class Config:
+                title = "mode_two"
+
+        modes = {DummyModeOne.Config.title: DummyModeOne, DummyModeTwo.Config.title: DummyModeTwo}
+
+        class DummyModel(BaseClientModel):
+            amount: Decimal = Field(
+                default=...,
+                client_data=ClientFieldData(prompt=lambda mi: "Amount", prompt_on_new=True),
+            )
+            mode: Union[DummyModeOne, DummyModeTwo] = Field(
+                default=...,
+                client_data=ClientFieldData(prompt=lambda mi: "Mode", prompt_on_new=True),
+            )
+
+            @validator("amount", pre=True)
+            def validate_amount(cls, v: str):
+                if Decimal(v) <= 0:
+                    raise ValueError("Value must be more than 0.")
+                return v
+
+            @validator("mode", pre=True)
+            def validate_mode(cls, v):
+                if isinstance(v, (DummyModeOne, DummyModeTwo)):
+                    return v
+                if v not in modes:
+                    raise ValueError(f"Invalid mode, please choose a value from {list(modes.keys())}.")
+                return modes[v].construct()
+
+        config_map = ClientConfigAdapter(DummyModel.construct())
+        self.cli_mock_assistant.queue_prompt_reply("0")  # invalid amount
+        self.cli_mock_assistant.queue_prompt_reply("2")  # valid amount
+        self.cli_mock_assistant.queue_prompt_reply("mode_one")  # mode
+        self.cli_mock_assistant.queue_prompt_reply("7")  # mode attr
+
+        self.async_run_with_timeout(self.app.prompt_for_model_config(config_map))
+
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(msg="Value must be more than 0."))
+        self.assertEqual(Decimal("2"), config_map.amount)
+        self.assertIsInstance(config_map.mode.hb_config, DummyModeOne)
+        self.assertEqual(7, config_map.mode.mode_attr)
+
+        self.cli_mock_assistant.queue_prompt_reply("8")  # mode attr
+
+        self.async_run_with_timeout(self.app.prompt_a_config(config_map, "mode.mode_attr"))
+
+        self.assertEqual(8, config_map.mode.mode_attr)
+
+    def test_prompt_a_config_runs_root_validators_of_the_model(self):
+        root_validated_values = []
+
+        class DummyModel(BaseClientModel):
+            some_attr: int = Field(
+                default=...,
+                client_data=ClientFieldData(prompt=lambda mi: "Some attr", prompt_on_new=True),
+            )
+
+            @root_validator(skip_on_failure=True)
+            def post_validations(cls, values):
+                root_validated_values.append(values["some_attr"])
+                return values
+
+        config_map = ClientConfigAdapter(DummyModel.construct())
+        self.cli_mock_assistant.queue_prompt_reply("3")
+
+        self.async_run_with_timeout(self.app.prompt_a_config(config_map, "some_attr"))
+
+        self.assertEqual(3, config_map.some_attr)
+        self.assertEqual([3], root_validated_values)
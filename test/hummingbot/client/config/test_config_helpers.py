@@ -6,7 +6,7 @@ from tempfile import TemporaryDirectory
 from typing import Awaitable, List, Optional
 from unittest.mock import MagicMock, patch
 
-from pydantic import Field, SecretStr
+from pydantic import Field, SecretStr, validator
 
 from hummingbot.client.config import config_helpers
 from hummingbot.client.config.client_config_map import ClientConfigMap, CommandShortcutModel
@@ -14,11 +14,14 @@ from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger
 from hummingbot.client.config.config_data_types import BaseClientModel, BaseConnectorConfigMap
 from hummingbot.client.config.config_helpers import (
     ClientConfigAdapter,
+    ConfigValidationError,
     ReadOnlyClientConfigAdapter,
     get_connector_config_yml_path,
     get_strategy_config_map,
+    get_strategy_template_path,
     load_connector_config_map_from_file,
     save_to_yml,
+    write_strategy_template,
 )
 from hummingbot.client.config.security import Security
 from hummingbot.client.config.strategy_config_data_types import BaseStrategyConfigMap
@@ -48,6 +51,15 @@ class ConfigHelpersTest(unittest.TestCase):
         self.assertIsInstance(cm.hb_config, AvellanedaMarketMakingConfigMap)
         self.assertFalse(hasattr(cm, "market"))  # uninitialized instance
 
+    def test_get_strategy_config_map_returns_new_instance_on_each_call(self):
+        cm = get_strategy_config_map(strategy="avellaneda_market_making")
+        other_cm = get_strategy_config_map(strategy="avellaneda_market_making")
+        self.assertIsNot(cm.hb_config, other_cm.hb_config)
+
+    def test_get_strategy_config_map_returns_shared_legacy_config_map(self):
+        cm = get_strategy_config_map(strategy="pure_market_making")
+        self.assertIs(cm, get_strategy_config_map(strategy="pure_market_making"))
+
     def test_save_to_yml(self):
         class DummyStrategy(BaseStrategyConfigMap):
             class Config:
@@ -71,6 +83,36 @@ strategy: pure_market_making
                 actual_str = f.read()
         self.assertEqual(expected_str, actual_str)
 
+    def test_save_to_yml_replaces_existing_file_keeping_its_mode(self):
+        class DummyStrategy(BaseStrategyConfigMap):
+            class Config:
+                title = "pure_market_making"
+
+            strategy: str = "pure_market_making"
+
+        cm = ClientConfigAdapter(DummyStrategy())
+        with TemporaryDirectory() as d:
+            d = Path(d)
+            temp_file_name = d / "cm.yml"
+            temp_file_name.write_text("some_old_content: 1\n")
+            temp_file_name.chmod(0o600)
+            save_to_yml(temp_file_name, cm)
+            actual_str = temp_file_name.read_text()
+            actual_mode = temp_file_name.stat().st_mode & 0o777
+            dir_content = list(d.iterdir())
+        self.assertIn("strategy: pure_market_making", actual_str)
+        self.assertNotIn("some_old_content", actual_str)
+        self.assertEqual(0o600, actual_mode)
+        self.assertEqual([temp_file_name], dir_content)
+
+    def test_write_strategy_template(self):
+        strategy = "pure_market_making"
+        with TemporaryDirectory() as d:
+            strategy_path = Path(d) / "conf_pure_mm_1.yml"
+            write_strategy_template(strategy, strategy_path)
+            actual_bytes = strategy_path.read_bytes()
+        self.assertEqual(get_strategy_template_path(strategy).read_bytes(), actual_bytes)
+
     def test_save_command_shortcuts_to_yml(self):
         class DummyStrategy(BaseClientModel):
             command_shortcuts: List[CommandShortcutModel] = Field(
@@ -137,6 +179,33 @@ strategy: pure_market_making
 
         self.assertEqual(cm, cm_loaded)
 
+    def test_validate_and_set(self):
+        class DummySubModel(BaseClientModel):
+            sub_attr: int = 1
+
+        class DummyModel(BaseClientModel):
+            some_attr: Decimal = Field(default=...)
+            sub_model: DummySubModel = Field(default=DummySubModel())
+
+            @validator("some_attr", pre=True)
+            def validate_some_attr(cls, v: str):
+                if Decimal(v) <= 0:
+                    raise ValueError("Value must be more than 0.")
+                return v
+
+        cm = ClientConfigAdapter(DummyModel.construct())
+
+        cm.validate_and_set("some_attr", "2")
+        self.assertEqual(Decimal("2"), cm.some_attr)
+        cm.validate_and_set("sub_model", DummySubModel(sub_attr=2))
+        self.assertIsInstance(cm.sub_model, ClientConfigAdapter)
+        self.assertEqual(2, cm.sub_model.sub_attr)
+
+        with self.assertRaises(ConfigValidationError) as context:
+            cm.validate_and_set("some_attr", "0")
+        self.assertEqual("Value must be more than 0.", str(context.exception))
+        self.assertEqual(Decimal("2"), cm.some_attr)
+
 
 class ReadOnlyClientAdapterTest(unittest.TestCase):
 